@@ -10,6 +10,7 @@ import secrets
 
 # Import the core game logic from game.py
 from game import Game
+from matchmaking import Matchmaker
 
 app = Flask(__name__)
 CORS(app) # Enable Cross-Origin Resource Sharing to allow the frontend to connect.
@@ -18,6 +19,33 @@ CORS(app) # Enable Cross-Origin Resource Sharing to allow the frontend to connec
 # The key is the game_id, and the value is a dictionary containing session metadata.
 games = {} 
 
+def create_session(mode, player1_name, player2_name, number_of_games):
+    """Creates a new game session and returns its game_id."""
+    # Generate a secure, URL-friendly 6-character ID for the new game.
+    alphabet = string.ascii_uppercase + string.digits
+    game_id = ''.join(secrets.choice(alphabet) for i in range(6))
+    # Create a new instance of the Game engine from game.py.
+    game_instance = Game(mode=mode)
+
+    # Store the game instance and all match-related metadata in the sessions dictionary.
+    # This separates the persistent match data from the round-specific game logic.
+    games[game_id] = {
+        "game_logic": game_instance,
+        "player1_name": player1_name,
+        "player2_name": player2_name,
+        "mode": mode,
+        "number_of_games": number_of_games,
+        "wins": {
+            Game.PLAYER_1: 0,
+            Game.PLAYER_2: 0
+        },
+        "match_winner": None
+    }
+    return game_id
+
+# The matchmaking queue pairs waiting players into vs_player sessions created by create_session.
+matchmaker = Matchmaker(lambda p1, p2, n: create_session("vs_player", p1, p2, n))
+
 @app.route("/")
 def index():
     return "<h1>Battleship API is running!</h1>"
@@ -44,26 +72,7 @@ def create_game():
         return jsonify({"error": "Invalid game mode"}), 400
 
     # --- Game Session Creation ---
-    # Generate a secure, URL-friendly 6-character ID for the new game.
-    alphabet = string.ascii_uppercase + string.digits
-    game_id = ''.join(secrets.choice(alphabet) for i in range(6))
-    # Create a new instance of the Game engine from game.py.
-    game_instance = Game(mode=mode)
-
-    # Store the game instance and all match-related metadata in the sessions dictionary.
-    # This separates the persistent match data from the round-specific game logic.
-    games[game_id] = {
-        "game_logic": game_instance,
-        "player1_name": player1_name,
-        "player2_name": player2_name,
-        "mode": mode,
-        "number_of_games": number_of_games,
-        "wins": {
-            Game.PLAYER_1: 0,
-            Game.PLAYER_2: 0
-        },
-        "match_winner": None
-    }
+    game_id = create_session(mode, player1_name, player2_name, number_of_games)
 
     # Return the new game details to the client so it can join the session.
     return jsonify({
@@ -178,6 +187,71 @@ def attack(game_id):
         "game_state": final_game_state
     })
 
+# --- Matchmaking ---
+# Instead of sharing a game code, players can join the matchmaking queue and long-poll their ticket
+# until the server pairs them with another player who wants the same number of games.
+MAX_LONG_POLL_SECONDS = 30
+
+def matchmaking_response(ticket):
+    """Builds the API representation of a matchmaking ticket."""
+    response = {
+        "ticket_id": ticket['ticket_id'],
+        "status": ticket['status'],
+        "player_name": ticket['player_name'],
+        "number_of_games": ticket['number_of_games']
+    }
+    if ticket['match']:
+        response.update(ticket['match'])
+    return response
+
+@app.route("/matchmaking", methods=["POST"])
+def join_matchmaking():
+    data = request.get_json()
+    if not data:
+        return jsonify({"error": "Request body must be JSON"}), 400
+
+    player_name = data.get("player_name")
+    number_of_games = data.get("number_of_games", 1)
+    if not player_name:
+        return jsonify({"error": "player_name is a required field"}), 400
+    if not isinstance(number_of_games, int) or isinstance(number_of_games, bool) or number_of_games < 1:
+        return jsonify({"error": "number_of_games must be a positive integer"}), 400
+
+    # An optional key chosen by the client; joining again with the same key returns the same ticket.
+    client_token = data.get("client_token")
+    if client_token is not None and not isinstance(client_token, str):
+        return jsonify({"error": "client_token must be a string"}), 400
+
+    ticket = matchmaker.enqueue(player_name, number_of_games, client_token)
+    return jsonify(matchmaking_response(ticket)), 201
+
+@app.route("/matchmaking/stats", methods=["GET"])
+def matchmaking_stats():
+    return jsonify(matchmaker.get_stats())
+
+@app.route("/matchmaking/<ticket_id>", methods=["GET"])
+def wait_for_match(ticket_id):
+    # The request blocks until a match is found or the timeout expires; clients then poll again.
+    try:
+        timeout = float(request.args.get('timeout', MAX_LONG_POLL_SECONDS))
+    except ValueError:
+        return jsonify({"error": "Invalid timeout"}), 400
+    timeout = max(0.0, min(timeout, MAX_LONG_POLL_SECONDS))
+
+    ticket = matchmaker.wait(ticket_id, timeout)
+    if not ticket:
+        return jsonify({"error": "Ticket not found"}), 404
+    return jsonify(matchmaking_response(ticket))
+
+@app.route("/matchmaking/<ticket_id>", methods=["DELETE"])
+def leave_matchmaking(ticket_id):
+    ticket = matchmaker.cancel(ticket_id)
+    if not ticket:
+        return jsonify({"error": "Ticket not found"}), 404
+    if ticket['status'] == 'matched':
+        return jsonify({"error": "Ticket has already been matched", **matchmaking_response(ticket)}), 409
+    return jsonify(matchmaking_response(ticket))
+
 # This block runs the Flask development server when the script is executed directly.
 if __name__ == "__main__":
     app.run(debug=True, port=5001)
@@ -0,0 +1,23 @@
+# battleship_client
+# A Python client for the Battleship API, mirroring src/BattleshipConnector.java.
+#
+# Example:
+#     from battleship_client import BattleshipClient
+#     with BattleshipClient("http://127.0.0.1:5001") as client:
+#         game = client.create_game("vs_bot", "Alice")
+#         client.attack(game['game_id'], game['player_1_id'], 0, 0)
+
+from .aio import AsyncBattleshipClient
+from .client import DEFAULT_BASE_URL, BattleshipAPIError, BattleshipClient, LatencyTracker, percentile
+from .transport import FlaskTransport, HTTPTransport
+
+__all__ = [
+    "AsyncBattleshipClient",
+    "BattleshipAPIError",
+    "BattleshipClient",
+    "DEFAULT_BASE_URL",
+    "FlaskTransport",
+    "HTTPTransport",
+    "LatencyTracker",
+    "percentile",
+]
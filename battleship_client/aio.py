@@ -0,0 +1,70 @@
+# battleship_client/aio.py
+# This file contains the asyncio variant of the Python client.
+# Each call runs a BattleshipClient request on a worker thread, so one event loop can drive many games
+# at once while requests share the same keep-alive connection pool.
+
+import asyncio
+import concurrent.futures
+import functools
+
+from .client import BattleshipClient
+
+
+class AsyncBattleshipClient:
+    """
+    An asyncio client for the Battleship API with the same methods as BattleshipClient.
+    Accepts the same arguments. max_concurrency limits how many requests are in flight at once,
+    and defaults to the connection pool size. Matchmaking long-polls can block for up to 35 seconds,
+    so they run on a separate set of up to max_long_polls threads and never hold up attacks or polls.
+    """
+    def __init__(self, max_concurrency=None, max_long_polls=64, **client_options):
+        self.client = BattleshipClient(**client_options)
+        if max_concurrency is None:
+            max_concurrency = client_options.get('pool_size', 10) or 10
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency)
+        self.long_poll_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_long_polls)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Waits for in-flight requests, then closes the worker threads and pooled connections."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.executor.shutdown)
+        await loop.run_in_executor(None, self.long_poll_executor.shutdown)
+        self.client.close()
+
+    async def _call(self, method, *args, executor=None, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor or self.executor, functools.partial(method, *args, **kwargs))
+
+    async def create_game(self, mode, player1_name, player2_name=None, number_of_games=1):
+        return await self._call(self.client.create_game, mode, player1_name, player2_name, number_of_games)
+
+    async def get_game_state(self, game_id, player_id):
+        return await self._call(self.client.get_game_state, game_id, player_id)
+
+    async def attack(self, game_id, player_id, row, col):
+        return await self._call(self.client.attack, game_id, player_id, row, col)
+
+    async def join_matchmaking(self, player_name, number_of_games=1, client_token=None):
+        return await self._call(self.client.join_matchmaking, player_name, number_of_games, client_token)
+
+    async def wait_for_match(self, ticket_id, timeout=30):
+        return await self._call(self.client.wait_for_match, ticket_id, timeout, executor=self.long_poll_executor)
+
+    async def leave_matchmaking(self, ticket_id):
+        return await self._call(self.client.leave_matchmaking, ticket_id)
+
+    async def matchmaking_stats(self):
+        return await self._call(self.client.matchmaking_stats)
+
+    async def batch(self, coroutines):
+        """
+        Awaits many calls concurrently and returns their results in order.
+        A call that fails has its exception returned in place of a result.
+        """
+        return await asyncio.gather(*coroutines, return_exceptions=True)
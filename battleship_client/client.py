@@ -0,0 +1,227 @@
+# battleship_client/client.py
+# This file contains the synchronous Python client for the Battleship API.
+# It exposes the same calls as src/BattleshipConnector.java (createGame, getGameState, attack),
+# plus the matchmaking endpoints, on top of a pooled transport with retries and latency tracing.
+
+import concurrent.futures
+import http.client
+import os
+import random
+import threading
+import time
+import uuid
+
+from .transport import HTTPTransport
+
+DEFAULT_BASE_URL = "http://127.0.0.1:5001" # The address hardcoded in BattleshipConnector.java.
+
+
+class BattleshipAPIError(Exception):
+    """Raised when the API rejects a request, e.g. "It is not your turn." or "Game not found"."""
+    def __init__(self, status, message, data=None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+        self.data = data
+
+
+class LatencyTracker:
+    """
+    A ready-made trace callback that keeps per-operation latencies and error counts.
+    Pass an instance as the client's trace argument and call summary() to read the results.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {} # operation name -> list of latencies in seconds
+        self.errors = {} # operation name -> number of failed calls
+
+    def __call__(self, event):
+        with self.lock:
+            self.latencies.setdefault(event['operation'], []).append(event['elapsed'])
+            if not event['ok']:
+                self.errors[event['operation']] = self.errors.get(event['operation'], 0) + 1
+
+    def summary(self):
+        """Returns count, errors and p50/p90/p99/max latency (in seconds) for each operation."""
+        result = {}
+        with self.lock:
+            for operation, values in self.latencies.items():
+                values = sorted(values)
+                result[operation] = {
+                    'count': len(values),
+                    'errors': self.errors.get(operation, 0),
+                    'p50': percentile(values, 50),
+                    'p90': percentile(values, 90),
+                    'p99': percentile(values, 99),
+                    'max': values[-1]
+                }
+        return result
+
+
+def percentile(sorted_values, percent):
+    """Returns the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, int(round(percent / 100.0 * len(sorted_values))) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class BattleshipClient:
+    """
+    A thread-safe client for the Battleship API.
+
+    By default it talks to BATTLESHIP_API_URL (or http://127.0.0.1:5001) over a pool of keep-alive
+    connections. Pass transport=FlaskTransport(app.app) to call the Flask app in-process instead.
+    Failed calls are retried with exponential backoff; trace, if given, is called after every
+    call with a dict describing it (operation, method, path, status, elapsed, attempts, ok).
+    Every call returns the full JSON response body, as BattleshipConnector.java does.
+    """
+    RETRY_STATUSES = (502, 503, 504)
+    LONG_POLL_MARGIN = 5 # Extra seconds the socket waits beyond a long-poll's server-side timeout.
+
+    def __init__(self, base_url=None, transport=None, pool_size=10, timeout=30,
+                 retries=3, backoff=0.1, max_backoff=2.0, trace=None):
+        if transport is None:
+            base_url = base_url or os.environ.get("BATTLESHIP_API_URL", DEFAULT_BASE_URL)
+            transport = HTTPTransport(base_url, pool_size=pool_size, timeout=timeout)
+        self.transport = transport
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.trace = trace
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Closes the transport's pooled connections."""
+        self.transport.close()
+
+    def _should_retry(self, error, idempotent):
+        """
+        Decides whether a failed attempt can be sent again.
+        Idempotent calls are safe to repeat. Other calls are only repeated if the server could not
+        have received them, so an attack is never applied twice.
+        """
+        return idempotent or isinstance(error, ConnectionRefusedError)
+
+    def _request(self, operation, method, path, payload=None, timeout=None, idempotent=None):
+        """
+        Sends a request with retries and tracing, and returns the decoded JSON body.
+        timeout overrides the socket timeout for this call. idempotent defaults to True for GET and DELETE;
+        it is passed to the transport too, so the same rule applies when a kept-alive connection drops.
+        """
+        if idempotent is None:
+            idempotent = method in ("GET", "DELETE")
+        start = time.perf_counter()
+        attempt = 0
+        status, data, error = None, None, None
+        while True:
+            attempt += 1
+            error = None
+            try:
+                status, data = self.transport.request(method, path, payload, timeout=timeout, idempotent=idempotent)
+            except (OSError, http.client.HTTPException) as e:
+                status, data, error = None, None, e
+
+            failed = error is not None or status in self.RETRY_STATUSES
+            if not failed or attempt > self.retries or not self._should_retry(error, idempotent):
+                break
+            # Exponential backoff with jitter, so many clients do not retry in lockstep.
+            delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+            time.sleep(random.uniform(0, delay))
+
+        ok = error is None and status < 400
+        if self.trace is not None:
+            self.trace({
+                'operation': operation,
+                'method': method,
+                'path': path,
+                'status': status,
+                'elapsed': time.perf_counter() - start,
+                'attempts': attempt,
+                'ok': ok
+            })
+
+        if error is not None:
+            raise error
+        if not ok:
+            message = data.get('error', 'Request failed') if isinstance(data, dict) else 'Request failed'
+            raise BattleshipAPIError(status, message, data)
+        return data
+
+    # --- Game endpoints (mirroring BattleshipConnector.java) ---
+
+    def create_game(self, mode, player1_name, player2_name=None, number_of_games=1):
+        """Creates a game and returns the server's response, including game_id and both player ids."""
+        payload = {
+            "mode": mode,
+            "player1_name": player1_name,
+            "player2_name": player2_name,
+            "number_of_games": number_of_games
+        }
+        return self._request("create", "POST", "/game", payload)
+
+    def get_game_state(self, game_id, player_id):
+        """Returns the server's response, whose game_state is seen from the perspective of one player."""
+        return self._request("poll", "GET", f"/game/{game_id}?player_id={player_id}")
+
+    def attack(self, game_id, player_id, row, col):
+        """Attacks a cell and returns the server's response (attack_result and the updated game_state)."""
+        payload = {"player_id": player_id, "row": row, "col": col}
+        return self._request("attack", "POST", f"/game/{game_id}/attack", payload)
+
+    # --- Matchmaking endpoints ---
+
+    def join_matchmaking(self, player_name, number_of_games=1, client_token=None):
+        """
+        Joins the matchmaking queue and returns the ticket (already matched if an opponent was waiting).
+        A random client_token is sent if none is given. The server returns the same ticket for a repeated
+        token, so the join is safe to retry.
+        """
+        payload = {
+            "player_name": player_name,
+            "number_of_games": number_of_games,
+            "client_token": client_token or uuid.uuid4().hex
+        }
+        return self._request("join", "POST", "/matchmaking", payload, idempotent=True)
+
+    def wait_for_match(self, ticket_id, timeout=30):
+        """
+        Long-polls a ticket once and returns it; its status is still 'waiting' if the timeout expired.
+        The socket waits a little longer than the server, so the server's answer is not cut off.
+        The server keeps matched tickets readable, so a retried long-poll still returns the match.
+        """
+        return self._request("wait", "GET", f"/matchmaking/{ticket_id}?timeout={timeout}",
+                             timeout=timeout + self.LONG_POLL_MARGIN)
+
+    def leave_matchmaking(self, ticket_id):
+        """Removes a waiting ticket from the matchmaking queue."""
+        return self._request("leave", "DELETE", f"/matchmaking/{ticket_id}")
+
+    def matchmaking_stats(self):
+        """Returns the matchmaking queue length and wait-time metrics."""
+        return self._request("stats", "GET", "/matchmaking/stats")
+
+    # --- Batching ---
+
+    def batch(self, calls, max_workers=None):
+        """
+        Runs many calls concurrently over the shared connection pool and returns their results in order.
+        calls is a list of (method, args) pairs, e.g. [(client.get_game_state, (game_id, 0)), ...].
+        A call that fails has its exception returned in place of a result.
+        """
+        def run(call):
+            method, args = call
+            try:
+                return method(*args)
+            except Exception as e:
+                return e
+
+        if not calls:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, calls))
@@ -0,0 +1,126 @@
+# battleship_client/transport.py
+# This file contains the transports used by the Python client to reach the Battleship API.
+# A transport sends one request and returns the HTTP status and decoded JSON body;
+# the client on top of it handles retries, errors and tracing.
+
+import http.client
+import json
+import queue
+import threading
+from urllib.parse import urlsplit
+
+
+class HTTPTransport:
+    """
+    Sends requests over persistent keep-alive HTTP connections.
+    Up to pool_size idle connections are kept and reused by any thread. A pool_size of 0
+    opens a new connection for every call, which is what BattleshipConnector.java does.
+    """
+    def __init__(self, base_url, pool_size=10, timeout=30):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme in {base_url!r}")
+        self.base_url = base_url
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path_prefix = parts.path.rstrip("/")
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.idle = queue.LifoQueue() # Most recently used connections first, as they are least likely to have timed out.
+        self.lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _acquire(self):
+        """Returns an idle connection from the pool, or a new one. The flag says whether it was reused."""
+        try:
+            return self.idle.get_nowait(), True
+        except queue.Empty:
+            with self.lock:
+                self.connections_opened += 1
+            return self.connection_class(self.host, self.port, timeout=self.timeout), False
+
+    def _release(self, conn):
+        """Returns a healthy connection to the pool, or closes it if the pool is full."""
+        if self.idle.qsize() < self.pool_size:
+            self.idle.put(conn)
+        else:
+            conn.close()
+
+    def request(self, method, path, payload=None, timeout=None, idempotent=None):
+        """
+        Sends one request and returns (status, decoded JSON body).
+        timeout overrides the transport's socket timeout for this call, e.g. for long-polls.
+        idempotent says whether the request may be resent; it defaults to True for GET and DELETE.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if idempotent is None:
+            idempotent = method in ("GET", "DELETE")
+        body = json.dumps(payload) if payload is not None else None
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json; utf-8"
+
+        while True:
+            conn, reused = self._acquire()
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, self.path_prefix + path, body=body, headers=headers)
+                response = conn.getresponse()
+                raw = response.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                conn.close()
+                # The server may close an idle keep-alive connection at any time.
+                # Idempotent requests are retried on another connection. Others, such as an attack,
+                # are never resent here, because the server may already have applied them.
+                if reused and idempotent:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            try:
+                data = json.loads(raw.decode("utf-8"))
+            except ValueError:
+                data = None # E.g. an empty body or an HTML error page.
+            return response.status, data
+
+    def close(self):
+        """Closes every idle connection in the pool."""
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class FlaskTransport:
+    """
+    Calls a Flask app in-process through its test client, without any sockets.
+    This lets bots and load tests drive app.app directly, e.g. FlaskTransport(app.app).
+    """
+    def __init__(self, app):
+        self.app = app
+        self.base_url = "flask://" + app.name
+        self.local = threading.local() # One test client per thread.
+
+    def request(self, method, path, payload=None, timeout=None, idempotent=None):
+        """
+        Sends one request and returns (status, decoded JSON body).
+        There is no socket, so timeout is ignored and nothing is ever resent.
+        """
+        test_client = getattr(self.local, "test_client", None)
+        if test_client is None:
+            test_client = self.local.test_client = self.app.test_client()
+        response = test_client.open(path, method=method, json=payload, headers={"Accept": "application/json"})
+        return response.status_code, response.get_json(silent=True)
+
+    def close(self):
+        pass
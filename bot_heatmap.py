@@ -0,0 +1,120 @@
+# bot_heatmap.py
+# This file contains the heatmap used by the bot's "Hunt" mode.
+# For every cell it counts how many positions of the opponent's remaining ships could cover it,
+# and the bot fires at the hottest cell. Every position, and which positions cover each cell, is indexed once per
+# (grid size, fleet) configuration when game.py is imported. Each game's heatmap is then updated incrementally:
+# an attacked cell only removes the positions that cover it, instead of recomputing the whole grid.
+#
+# Running this file directly compares the heatmap hunt against a random hunt.
+# Usage: python bot_heatmap.py [games]
+
+import random
+import sys
+
+
+def build_hunt_index(grid_size, ship_sizes):
+    """
+    Lists every position each ship size can occupy on an empty board, and which positions cover each cell.
+    Returns a dictionary with:
+      'placements': ship size -> list of cell tuples
+      'covering': (row, col) -> list of (ship size, position index) pairs covering that cell
+    """
+    placements = {}
+    covering = {(r, c): [] for r in range(grid_size) for c in range(grid_size)}
+    for size in sorted(set(ship_sizes)):
+        # A one-cell ship is the same horizontally and vertically, so only count it once.
+        directions = [(0, 1)] if size == 1 else [(0, 1), (1, 0)]
+        positions = []
+        for dr, dc in directions:
+            for row in range(grid_size - dr * (size - 1)):
+                for col in range(grid_size - dc * (size - 1)):
+                    cells = tuple((row + dr * i, col + dc * i) for i in range(size))
+                    for cell in cells:
+                        covering[cell].append((size, len(positions)))
+                    positions.append(cells)
+        placements[size] = positions
+    return {'grid_size': grid_size, 'placements': placements, 'covering': covering}
+
+
+class HuntHeatmap:
+    """
+    One game's heatmap of the opponent's board.
+    For each ship size it tracks how many still-possible positions cover each cell, and the combined density
+    weights those counts by how many ships of that size are left.
+    """
+    def __init__(self, index, ship_sizes):
+        self.index = index
+        self.grid_size = index['grid_size']
+        self.remaining = {size: ship_sizes.count(size) for size in index['placements']}
+        self.alive = {size: [True] * len(positions) for size, positions in index['placements'].items()}
+        self.coverage = {size: {cell: 0 for cell in index['covering']} for size in index['placements']}
+        self.density = {cell: 0 for cell in index['covering']}
+        for size, positions in index['placements'].items():
+            for cells in positions:
+                for cell in cells:
+                    self.coverage[size][cell] += 1
+                    self.density[cell] += self.remaining[size]
+        self.attacks_seen = 0 # Number of entries of the board's attack log already applied.
+
+    def _cell_attacked(self, cell):
+        """Removes every still-possible position that covers a newly attacked cell."""
+        for size, position in self.index['covering'][cell]:
+            if not self.alive[size][position]:
+                continue
+            self.alive[size][position] = False
+            weight = self.remaining[size]
+            for covered in self.index['placements'][size][position]:
+                self.coverage[size][covered] -= 1
+                self.density[covered] -= weight
+
+    def ship_sunk(self, size):
+        """Lowers the weight of a ship size once one of those ships has been sunk."""
+        if self.remaining.get(size, 0) <= 0:
+            return
+        self.remaining[size] -= 1
+        for cell, count in self.coverage[size].items():
+            self.density[cell] -= count
+
+    def update(self, attack_log):
+        """Applies the attacks made since the last update, including cells revealed around sunk ships."""
+        while self.attacks_seen < len(attack_log):
+            self._cell_attacked(attack_log[self.attacks_seen])
+            self.attacks_seen += 1
+
+    def best_cell(self, attacks):
+        """
+        Returns the un-attacked cell covered by the most possible positions of the remaining ships,
+        or None if no ship can fit anywhere. Ties are broken randomly so the bot's shots are not predictable.
+        """
+        best_cells, best_score = [], 0
+        for cell, score in self.density.items():
+            if score <= 0 or cell in attacks:
+                continue
+            if score > best_score:
+                best_cells, best_score = [cell], score
+            elif score == best_score:
+                best_cells.append(cell)
+        return random.choice(best_cells) if best_cells else None
+
+
+def average_bot_shots(games, heatmap=True):
+    """Plays the bot against random fleets and returns the average number of shots it needs to sink them all."""
+    from game import Game # Imported here because game.py imports this module.
+
+    total_shots = 0
+    for _ in range(games):
+        game = Game(mode='vs_bot')
+        if not heatmap:
+            game._bot_hunt_target = lambda board: None # The bot falls back to random hunting.
+        # Only the bot attacks; the human player's turns are skipped.
+        while not game.game_over:
+            game._bot_single_attack()
+            total_shots += 1
+    return total_shots / games
+
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"Average shots to sink the fleet over {games} games:")
+    print(f"  random hunt:  {average_bot_shots(games, heatmap=False):.1f}")
+    print(f"  heatmap hunt: {average_bot_shots(games, heatmap=True):.1f}")
@@ -4,6 +4,8 @@
 
 import random
 
+from bot_heatmap import HuntHeatmap, build_hunt_index
+
 class Game:
     """
     Manages the entire state of a single Battleship round, including player boards,
@@ -17,6 +19,9 @@ class Game:
     
     SHIP_NAMES = {4: "Battleship", 3: "Cruiser", 2: "Destroyer", 1: "Submarine"}
 
+    # Every position each ship size can take, used by the bot's "Hunt" mode. Built once at import time.
+    HUNT_INDEX = build_hunt_index(GRID_SIZE, SHIP_SIZES)
+
     def __init__(self, mode='vs_bot'):
         """
         Initializes a new game round.
@@ -28,6 +33,7 @@ class Game:
             self.PLAYER_2: {'board': Board(self.GRID_SIZE), 'ships_placed': True}
         }
         self.bot_target_list = [] # A priority queue for the bot's "Target" mode.
+        self._reset_bot_hunt()
     
         #Automatically place ships for both players ---
         self._randomly_place_ships(self.PLAYER_1)
@@ -53,6 +59,18 @@ class Game:
                 # The Board class's place_ship method handles all placement validation.
                 placed = player_board.place_ship(size, row, col, orientation)
 
+    def _reset_bot_hunt(self):
+        """Resets what the bot's "Hunt" mode knows about the opponent's fleet for a new round."""
+        # Created on the bot's first hunt shot, so games without a bot never build one.
+        self.bot_heatmap = None
+
+    def _bot_hunt_target(self, player_board):
+        """Returns the cell that the most positions of the remaining ships could cover, or None."""
+        if self.bot_heatmap is None:
+            self.bot_heatmap = HuntHeatmap(self.HUNT_INDEX, self.SHIP_SIZES)
+        self.bot_heatmap.update(player_board.attack_log)
+        return self.bot_heatmap.best_cell(player_board.attacks)
+
     def _are_all_ships_placed(self):
         """A utility to check if both players have finished placing their ships."""
         return all(self.players[p]['ships_placed'] for p in self.players)
@@ -143,8 +161,14 @@ class Game:
         """Makes one "smart" attack for the bot using Hunt/Target logic."""
         if self.bot_target_list:
             row, col = self.bot_target_list.pop()
-        # HUNT mode: Otherwise, fire at a random, un-attacked cell.    
+        # HUNT mode: Otherwise, fire at the cell that the most positions of the remaining ships could cover.
         else:
+            target = self._bot_hunt_target(player_board)
+            if target:
+                row, col = target
+
+        # Fall back to a random, un-attacked cell if no remaining ship fits anywhere.
+        if row == -1:
             while True:
                 r = random.randint(0, self.GRID_SIZE - 1)
                 c = random.randint(0, self.GRID_SIZE - 1)
@@ -158,6 +182,8 @@ class Game:
         # Update bot's strategy based on the result. Update event messages for display on the frontend.
         if result == 'sunk':
             self.bot_target_list = [] # A sink resets the targeting logic.
+            if self.bot_heatmap is not None:
+                self.bot_heatmap.ship_sunk(ship_info['size'])
             ship_name = self.SHIP_NAMES.get(ship_info['size'], "ship")
             self.last_event_messages[self.PLAYER_1] = f"The bot sunk your {ship_name}!"
             self.last_event_messages[self.PLAYER_2] = f"You sunk their {ship_name}!"
@@ -227,6 +253,7 @@ class Game:
         self.winner = None
         self.last_event_messages = {self.PLAYER_1: "", self.PLAYER_2: ""}
         self.bot_target_list = [] # Also reset the target list for a new round
+        self._reset_bot_hunt()
     
         # Randomly place ships for both players for the new round.
         self._randomly_place_ships(self.PLAYER_1)
@@ -245,6 +272,7 @@ class Board:
         self.grid = [['~' for _ in range(size)] for _ in range(size)] # '~' for water
         self.ships = []
         self.attacks = set() # Stores (row, col) tuples of attacks
+        self.attack_log = [] # The same cells in the order they were attacked or revealed
         self.sunk_ships_count = 0
 
     def place_ship(self, size, row, col, orientation):
@@ -290,6 +318,7 @@ class Board:
             return 'already_attacked', None
 
         self.attacks.add((row, col))
+        self.attack_log.append((row, col))
 
         # Check if the attack hit any ship.
         for ship in self.ships:
@@ -304,8 +333,9 @@ class Board:
                     for r_ship, c_ship in ship['coords']:
                         for i in range(r_ship - 1, r_ship + 2):
                             for j in range(c_ship - 1, c_ship + 2):
-                                if 0 <= i < self.size and 0 <= j < self.size:
+                                if 0 <= i < self.size and 0 <= j < self.size and (i, j) not in self.attacks:
                                     self.attacks.add((i, j))
+                                    self.attack_log.append((i, j))
                     
                     return 'sunk', {'size': len(ship['coords']), 'coords': ship['coords']}
                 return 'hit', None
@@ -0,0 +1,235 @@
+# load_test.py
+# This file is a load generator for the Battleship API.
+# It simulates many concurrent clients that speak the same protocol as src/BattleshipConnector.java
+# (create a game, poll its state, attack) and reports throughput, latency percentiles and error rates.
+# Requests go through the battleship_client package, so the test can use keep-alive connections,
+# one connection per call like the Java client (--connections 0), or the Flask app in-process (--in-process).
+#
+# Usage: python load_test.py --launch --pvp 10 --bots 20
+# Run "python load_test.py --help" for all options.
+
+import argparse
+import http.client
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+from battleship_client import BattleshipAPIError, BattleshipClient, FlaskTransport, LatencyTracker
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5001 # The port hardcoded in BattleshipConnector.java.
+DEFAULT_POLL_INTERVAL = 3.0 # Matches the Java client's 3 second pollingTimer.
+
+
+class Stats(LatencyTracker):
+    """
+    Collects request latencies and errors from every simulated client in a thread-safe way.
+    It is passed to the client as its trace callback, and also counts matches.
+    """
+    def __init__(self):
+        super().__init__()
+        self.matches_started = 0
+        self.matches_finished = 0
+
+    def count_match(self, finished):
+        """Counts a match as started, or as finished once a match winner is known."""
+        with self.lock:
+            if finished:
+                self.matches_finished += 1
+            else:
+                self.matches_started += 1
+
+    def report(self, elapsed):
+        """Prints a summary of throughput, latency percentiles and error rates per endpoint."""
+        summary = self.summary()
+        total = sum(row['count'] for row in summary.values())
+        total_errors = sum(row['errors'] for row in summary.values())
+        print("=" * 72)
+        print(f"Duration: {elapsed:.1f}s   Requests: {total}   Throughput: {total / elapsed:.1f} req/s")
+        print(f"Matches started: {self.matches_started}   Matches finished: {self.matches_finished}")
+        error_rate = 100.0 * total_errors / total if total else 0.0
+        print(f"Errors: {total_errors} ({error_rate:.2f}%)")
+        print("-" * 72)
+        print(f"{'endpoint':<10}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for endpoint in sorted(summary):
+            row = summary[endpoint]
+            print(f"{endpoint:<10}{row['count']:>8}{row['errors']:>8}{row['p50'] * 1000:>10.1f}"
+                  f"{row['p90'] * 1000:>10.1f}{row['p99'] * 1000:>10.1f}{row['max'] * 1000:>10.1f}")
+        print("=" * 72)
+
+
+class SimulatedPlayer(threading.Thread):
+    """
+    A single simulated client. Like the Java frontend, it polls the game state on a timer
+    and attacks a random unexplored cell whenever it is its turn.
+    """
+    def __init__(self, client, stats, game_id, player_id, think_time, poll_interval, stop_event):
+        super().__init__(daemon=True)
+        self.client = client
+        self.stats = stats
+        self.game_id = game_id
+        self.player_id = player_id
+        self.think_time = think_time
+        self.poll_interval = poll_interval
+        self.stop_event = stop_event
+
+    def _poll(self):
+        """Fetches the game state, or returns None if the request failed (the failure is already recorded)."""
+        try:
+            return self.client.get_game_state(self.game_id, self.player_id)['game_state']
+        except (BattleshipAPIError, OSError, http.client.HTTPException):
+            return None
+
+    def run(self):
+        state = self._poll()
+        while not self.stop_event.is_set():
+            if state is not None and state['match_winner'] is not None:
+                # Both players see the end of a PvP match, so only player 1 counts it.
+                if self.player_id == 0:
+                    self.stats.count_match(finished=True)
+                return
+
+            if state is not None and state['current_turn'] == self.player_id and not state['game_over']:
+                # Simulate the time a human takes to pick a cell.
+                if self.stop_event.wait(random.uniform(0, 2 * self.think_time)):
+                    return
+                row, col = self._choose_target(state['opponent_board'])
+                try:
+                    state = self.client.attack(self.game_id, self.player_id, row, col)['game_state']
+                    continue
+                except (BattleshipAPIError, OSError, http.client.HTTPException):
+                    # Back off before polling again, so a rejected attack does not loop without delay.
+                    if self.stop_event.wait(self.poll_interval):
+                        return
+            elif self.stop_event.wait(self.poll_interval):
+                return
+
+            state = self._poll()
+
+    def _choose_target(self, opponent_board):
+        """Picks a random cell that is still hidden on the opponent's board."""
+        hidden = [(r, c) for r, row in enumerate(opponent_board) for c, cell in enumerate(row) if cell == '?']
+        return random.choice(hidden)
+
+
+def start_match(client, stats, index, args, stop_event):
+    """Creates one match and returns the simulated player threads that will play it."""
+    mode = "vs_player" if index < args.pvp else "vs_bot"
+    player2_name = f"load-p2-{index}" if mode == "vs_player" else "Bot"
+    try:
+        response = client.create_game(mode, f"load-p1-{index}", player2_name, args.number_of_games)
+    except (BattleshipAPIError, OSError, http.client.HTTPException):
+        return []
+    stats.count_match(finished=False)
+
+    player_ids = [response['player_1_id']]
+    if mode == "vs_player":
+        player_ids.append(response['player_2_id'])
+    return [
+        SimulatedPlayer(client, stats, response['game_id'], player_id, args.think_time, args.poll_interval, stop_event)
+        for player_id in player_ids
+    ]
+
+
+def _server_responds(host, port):
+    """Returns True if an HTTP server answers on host:port."""
+    try:
+        conn = http.client.HTTPConnection(host, port, timeout=1)
+        conn.request("GET", "/")
+        conn.getresponse().read()
+        conn.close()
+        return True
+    except (OSError, http.client.HTTPException):
+        return False
+
+
+def launch_server(host, port):
+    """Starts app.py in a subprocess without the debug reloader and waits until it accepts requests."""
+    # Refuse to start if the port is taken, otherwise the test would silently run against another server.
+    if _server_responds(host, port):
+        raise RuntimeError(f"Another server is already running on {host}:{port}.")
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "flask", "--app", "app", "run", "--host", host, "--port", str(port)],
+        cwd=app_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"The Flask app exited before starting on {host}:{port} (is the port in use?).")
+        if _server_responds(host, port):
+            # Make sure the server that answered is ours and not one that grabbed the port meanwhile.
+            if server.poll() is not None:
+                raise RuntimeError(f"The Flask app exited before starting on {host}:{port} (is the port in use?).")
+            return server
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"The Flask app did not start on {host}:{port}.")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Battleship API with simulated clients.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="API host (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="API port (default: %(default)s)")
+    parser.add_argument("--launch", action="store_true", help="start app.py locally for the duration of the test")
+    parser.add_argument("--in-process", action="store_true",
+                        help="call app.app directly through its test client instead of over HTTP")
+    parser.add_argument("--connections", type=int, default=10,
+                        help="keep-alive connection pool size; 0 opens a connection per call like the Java client")
+    parser.add_argument("--pvp", type=int, default=5, help="number of concurrent vs_player matches")
+    parser.add_argument("--bots", type=int, default=5, help="number of concurrent vs_bot matches")
+    parser.add_argument("--number-of-games", type=int, default=1, help="rounds needed to win each match")
+    parser.add_argument("--think-time", type=float, default=0.5, help="mean seconds a player waits before attacking")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help="seconds between state polls (default: %(default)s)")
+    parser.add_argument("--duration", type=float, default=120.0, help="maximum test length in seconds")
+    args = parser.parse_args(argv)
+    if args.launch and args.in_process:
+        parser.error("--launch and --in-process cannot be used together")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = launch_server(args.host, args.port) if args.launch else None
+    stats = Stats()
+    # Retries are disabled so that every failed request shows up in the error rate.
+    if args.in_process:
+        import app
+        client = BattleshipClient(transport=FlaskTransport(app.app), retries=0, trace=stats)
+    else:
+        client = BattleshipClient(f"http://{args.host}:{args.port}", pool_size=args.connections,
+                                  retries=0, trace=stats)
+    stop_event = threading.Event()
+
+    try:
+        start = time.perf_counter()
+        players = []
+        for index in range(args.pvp + args.bots):
+            players.extend(start_match(client, stats, index, args, stop_event))
+        for player in players:
+            player.start()
+
+        # Wait until every match has finished or the time limit is reached.
+        deadline = start + args.duration
+        for player in players:
+            player.join(max(0.0, deadline - time.perf_counter()))
+        stop_event.set()
+        for player in players:
+            player.join()
+        stats.report(time.perf_counter() - start)
+    except KeyboardInterrupt:
+        stop_event.set()
+        print("\nLoad test interrupted.")
+    finally:
+        client.close()
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
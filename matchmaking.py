@@ -0,0 +1,207 @@
+# matchmaking.py
+# This file contains the matchmaking queue for player-vs-player games.
+# Waiting players are paired by their number_of_games preference, and each pairing becomes a normal
+# vs_player session on the server. It is decoupled from Flask: app.py exposes it through HTTP endpoints.
+
+import secrets
+import string
+import threading
+import time
+from collections import OrderedDict, deque
+
+from game import Game
+
+
+def _percentile(sorted_values, percent):
+    """Returns the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, int(round(percent / 100.0 * len(sorted_values))) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class Matchmaker:
+    """
+    Pairs waiting players into vs_player matches.
+    Each player receives a ticket. Clients long-poll their ticket until a match is found,
+    instead of repeatedly polling the server.
+    """
+    TICKET_TTL = 60 # Seconds a ticket survives without its client polling it, whether waiting or matched.
+    WAIT_HISTORY = 1000 # Number of recent wait times kept for the metrics.
+
+    def __init__(self, create_match):
+        """
+        create_match is called as create_match(player1_name, player2_name, number_of_games)
+        whenever two players are paired, and must return the new game_id.
+        """
+        self.create_match = create_match
+        self.lock = threading.Lock()
+        self.queues = {} # number_of_games -> OrderedDict of waiting ticket ids, oldest first
+        self.tickets = {} # ticket_id -> ticket dictionary
+        self.expiry = OrderedDict() # ticket ids, least recently polled first
+        self.client_tokens = {} # client_token -> ticket_id, so a repeated join returns the same ticket
+        self.waiting_count = 0
+        self.matches_made = 0
+        self.expired_count = 0
+        self.wait_times = deque(maxlen=self.WAIT_HISTORY)
+
+    def _new_ticket_id(self):
+        """Generates a unique, URL-friendly ticket ID."""
+        alphabet = string.ascii_uppercase + string.digits
+        while True:
+            ticket_id = ''.join(secrets.choice(alphabet) for i in range(12))
+            if ticket_id not in self.tickets:
+                return ticket_id
+
+    def _touch(self, ticket, now):
+        """Records that a ticket's client is still polling it."""
+        ticket['last_seen'] = now
+        self.expiry.move_to_end(ticket['ticket_id'])
+
+    def _leave_queue(self, ticket, status):
+        """Removes a waiting ticket from its queue."""
+        ticket['status'] = status
+        queue = self.queues[ticket['number_of_games']]
+        del queue[ticket['ticket_id']]
+        if not queue:
+            del self.queues[ticket['number_of_games']]
+        self.waiting_count -= 1
+
+    def _forget(self, ticket):
+        """Removes a ticket from the matchmaker entirely."""
+        del self.tickets[ticket['ticket_id']]
+        self.expiry.pop(ticket['ticket_id'], None)
+        if ticket['client_token'] is not None:
+            self.client_tokens.pop(ticket['client_token'], None)
+
+    def _expire_stale(self, now):
+        """
+        Drops tickets that have not been polled within TICKET_TTL, waiting or matched.
+        The expiry order is least recently polled first, so only the stale tickets at its head are looked at.
+        """
+        while self.expiry:
+            ticket = self.tickets[next(iter(self.expiry))]
+            if now - ticket['last_seen'] <= self.TICKET_TTL:
+                return
+            if ticket['status'] == 'waiting':
+                self._leave_queue(ticket, 'expired')
+                self.expired_count += 1
+            self._forget(ticket)
+            ticket['event'].set()
+
+    def enqueue(self, player_name, number_of_games, client_token=None):
+        """
+        Adds a player to the queue, or pairs them at once with the longest-waiting player
+        who wants the same number of games. Returns the player's ticket.
+        client_token is an optional key chosen by the client. Joining again with the same token returns the
+        existing ticket, so a client whose response was lost does not queue twice or end up matched with itself.
+        """
+        now = time.time()
+        with self.lock:
+            self._expire_stale(now)
+            if client_token is not None and client_token in self.client_tokens:
+                ticket = self.tickets[self.client_tokens[client_token]]
+                self._touch(ticket, now)
+                return ticket
+
+            ticket = {
+                'ticket_id': self._new_ticket_id(),
+                'player_name': player_name,
+                'number_of_games': number_of_games,
+                'client_token': client_token,
+                'status': 'waiting',
+                'enqueued_at': now,
+                'last_seen': now,
+                'match': None,
+                'event': threading.Event()
+            }
+            self.tickets[ticket['ticket_id']] = ticket
+            self.expiry[ticket['ticket_id']] = None
+            if client_token is not None:
+                self.client_tokens[client_token] = ticket['ticket_id']
+
+            queue = self.queues.get(number_of_games)
+            if not queue:
+                self.queues[number_of_games] = OrderedDict([(ticket['ticket_id'], None)])
+                self.waiting_count += 1
+                return ticket
+
+            # The player who waited longest becomes player 1 and takes the first turn.
+            opponent = self.tickets[next(iter(queue))]
+            self._leave_queue(opponent, 'matched')
+            game_id = self.create_match(opponent['player_name'], player_name, number_of_games)
+            self._assign(opponent, game_id, Game.PLAYER_1, player_name, now)
+            self._assign(ticket, game_id, Game.PLAYER_2, opponent['player_name'], now)
+            self.matches_made += 1
+            return ticket
+
+    def _assign(self, ticket, game_id, player_id, opponent_name, now):
+        """Marks a ticket as matched and wakes up any client long-polling it."""
+        ticket['status'] = 'matched'
+        ticket['match'] = {
+            'game_id': game_id,
+            'player_id': player_id,
+            'opponent_name': opponent_name,
+            'number_of_games': ticket['number_of_games']
+        }
+        self.wait_times.append(now - ticket['enqueued_at'])
+        ticket['event'].set()
+
+    def wait(self, ticket_id, timeout):
+        """
+        Blocks for up to timeout seconds until the ticket is matched.
+        Returns the ticket, or None if it does not exist.
+        A matched ticket stays readable until it has not been polled for TICKET_TTL seconds,
+        so a client whose response was lost can ask again.
+        """
+        with self.lock:
+            self._expire_stale(time.time())
+            ticket = self.tickets.get(ticket_id)
+            if ticket is None:
+                return None
+            self._touch(ticket, time.time())
+
+        ticket['event'].wait(timeout)
+
+        with self.lock:
+            if ticket_id in self.tickets:
+                self._touch(ticket, time.time())
+        return ticket
+
+    def cancel(self, ticket_id):
+        """
+        Removes a waiting ticket from the queue.
+        Returns the ticket (whose status shows whether it was cancelled or already matched), or None.
+        """
+        with self.lock:
+            ticket = self.tickets.get(ticket_id)
+            if ticket is None:
+                return None
+            if ticket['status'] == 'waiting':
+                self._leave_queue(ticket, 'cancelled')
+                self._forget(ticket)
+                ticket['event'].set()
+            return ticket
+
+    def get_stats(self):
+        """Reports queue lengths and wait-time metrics."""
+        now = time.time()
+        with self.lock:
+            self._expire_stale(now)
+            queue_lengths = {key: len(queue) for key, queue in self.queues.items()}
+            # Each queue is oldest first, so only its head is needed for the longest current wait.
+            oldest_wait = max((now - self.tickets[next(iter(queue))]['enqueued_at'] for queue in self.queues.values()),
+                              default=0.0)
+            waiting_count = self.waiting_count
+            wait_times = sorted(self.wait_times)
+
+        return {
+            'queue_length': waiting_count,
+            'queue_lengths_by_number_of_games': queue_lengths,
+            'matches_made': self.matches_made,
+            'expired_tickets': self.expired_count,
+            'oldest_wait_seconds': round(oldest_wait, 3),
+            'wait_seconds_p50': round(_percentile(wait_times, 50), 3),
+            'wait_seconds_p90': round(_percentile(wait_times, 90), 3),
+            'wait_seconds_max': round(wait_times[-1], 3) if wait_times else 0.0
+        }